@@ -6,8 +6,22 @@ from __future__ import annotations
 
 import datetime
 import enum
-import re
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
+import os
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import arrow
 import dateutil
@@ -19,22 +33,45 @@ from mdformat.renderer import MDRenderer
 from mdit_py_plugins.front_matter import front_matter_plugin  # type: ignore
 from pydantic import BaseModel, root_validator, validator
 
+from semaphore.config import config
+
 from .models import (
     BroadcastCategory,
     BroadcastMessage,
     FixedExpirationScheduler,
+    MonthlyNthWeekdayScheduler,
     OneTimeScheduler,
     OpenEndedScheduler,
     PermaScheduler,
     RecurringScheduler,
 )
 
+try:
+    import cmarkgfm
+except ImportError:
+    cmarkgfm = None
+
+try:
+    # The C-accelerated loader (libyaml) parses front matter much faster
+    # than the pure-Python one, but PyYAML may be built without it.
+    _YamlLoader: Any = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from markdown_it.token import Token
 
     from .models import Scheduler
 
-__all__ = ["BroadcastMarkdown", "BroadcastMarkdownFrontMatter"]
+__all__ = [
+    "BroadcastMarkdown",
+    "BroadcastMarkdownFrontMatter",
+    "is_inline_renderable",
+    "render_gfm",
+    "render_gfm_many",
+]
 
 md = MarkdownIt("gfm-like").use(front_matter_plugin)
 """Markdown parser tuned for GitHub Flavored Markdown syntax and supporting
@@ -43,24 +80,196 @@ front matter.
 See https://markdown-it-py.readthedocs.io/en/latest/using.html#the-parser
 """
 
-timespan_pattern = re.compile(
-    r"((?P<weeks>\d+?)\s*(weeks|week|w))?\s*"
-    r"((?P<days>\d+?)\s*(days|day|d))?\s*"
-    r"((?P<hours>\d+?)\s*(hours|hour|hr|h))?\s*"
-    r"((?P<minutes>\d+?)\s*(minutes|minute|mins|min|m))?\s*"
-    r"((?P<seconds>\d+?)\s*(seconds|second|secs|sec|s))?$"
-)
-"""Regular expression pattern for a time duration."""
+html_md = MarkdownIt("gfm-like")
+"""Markdown parser for rendering broadcast content to HTML."""
+
+md_renderer = MDRenderer()
+"""Renderer for converting markdown tokens back to markdown text.
+
+MDRenderer is stateless, so one instance is shared by all
+`BroadcastMarkdown.body` renders.
+"""
+
+
+def render_gfm(text: str, inline: bool = False) -> str:
+    """Render GitHub-flavored markdown to HTML.
+
+    Parameters
+    ----------
+    text : `str`
+        GitHub-flavored markdown content.
+    inline : `bool`
+        If `True`, no paragraph tags are added to the HTML content.
+
+    Returns
+    -------
+    `str`
+        The HTML-formatted content.
+    """
+    if config.enable_compiled_markdown and cmarkgfm is not None:
+        html = cmarkgfm.github_flavored_markdown_to_html(text)
+        if inline:
+            html = html.strip()
+            if html.startswith("<p>") and html.endswith("</p>"):
+                html = html[3:-4]
+        return html
+    if inline:
+        return html_md.renderInline(text)
+    else:
+        return html_md.render(text)
+
+
+def is_inline_renderable(text: str) -> bool:
+    """Determine whether markdown text is a single plain paragraph, so
+    that rendering it with the inline rules alone produces the same HTML
+    as the block renderer minus the wrapping ``<p>`` tags.
+
+    The absence of a blank line is not sufficient: headings, lists, and
+    other block constructs contain no blank line but still need the
+    block tokenizer.
+
+    Parameters
+    ----------
+    text : `str`
+        GitHub-flavored markdown content.
+
+    Returns
+    -------
+    `bool`
+        `True` if the text parses to a single paragraph block.
+    """
+    if "\n\n" in text:
+        return False
+    tokens = html_md.parse(text)
+    return (
+        len(tokens) == 3
+        and tokens[0].type == "paragraph_open"
+        and tokens[2].type == "paragraph_close"
+    )
+
+
+def render_gfm_many(texts: Sequence[str]) -> List[str]:
+    """Render several GitHub-flavored markdown texts to HTML in a single
+    parser pass.
+
+    The texts are joined with a unique HTML-comment sentinel, rendered
+    once, and the rendered HTML is split back apart on the sentinel. This
+    amortizes the parser's per-call rule dispatch across all of the texts.
+    If a text interferes with the sentinel (for example, by opening a
+    fenced code block that swallows it), the function falls back to
+    rendering each text individually. When the compiled cmarkgfm renderer
+    is enabled, every text is rendered individually through `render_gfm`
+    so that all texts use the same renderer.
+
+    Parameters
+    ----------
+    texts : sequence of `str`
+        GitHub-flavored markdown texts.
+
+    Returns
+    -------
+    list of `str`
+        The HTML-formatted texts, in the same order as the input.
+    """
+    if len(texts) < 2 or (
+        config.enable_compiled_markdown and cmarkgfm is not None
+    ):
+        return [render_gfm(text) for text in texts]
+
+    sentinel = f"<!--semaphore-render-{uuid.uuid4().hex}-->"
+    joined = f"\n\n{sentinel}\n\n".join(texts)
+    rendered = html_md.render(joined)
+    parts = rendered.split(sentinel)
+    if len(parts) != len(texts):
+        return [render_gfm(text) for text in texts]
+    # Trim the newlines introduced around the sentinel so that each part
+    # matches what an individual render would have produced.
+    return [part.strip("\n") + "\n" if part else part for part in parts]
+
+
+_timespan_units = {
+    "w": "weeks",
+    "week": "weeks",
+    "weeks": "weeks",
+    "d": "days",
+    "day": "days",
+    "days": "days",
+    "h": "hours",
+    "hr": "hours",
+    "hour": "hours",
+    "hours": "hours",
+    "m": "minutes",
+    "min": "minutes",
+    "mins": "minutes",
+    "minute": "minutes",
+    "minutes": "minutes",
+    "s": "seconds",
+    "sec": "seconds",
+    "secs": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+}
+"""Mapping of unit spellings to `datetime.timedelta` argument names."""
+
+_timespan_unit_ranks = {
+    "weeks": 0,
+    "days": 1,
+    "hours": 2,
+    "minutes": 3,
+    "seconds": 4,
+}
+"""Ordering of timespan units, largest first.
+
+Terms in a timespan must appear at most once each, in this order,
+matching the regex the scanner in `parse_timedelta` replaced.
+"""
+
+_gettz = lru_cache(maxsize=64)(dateutil.tz.gettz)
+"""Memoized timezone lookup.
+
+Broadcast files overwhelmingly name the same few zones, so repeated
+lookups skip dateutil's zone-file resolution.
+"""
 
 
 def parse_timedelta(text: str) -> datetime.timedelta:
     """Parse a `datetime.timedelta` from a string containing integer numbers
     of weeks, days, hours, minutes, and seconds.
     """
-    m = timespan_pattern.match(text.strip())
-    if m is None:
-        raise ValueError(f"Could not parse a timespan from {text!r}.")
-    td_args = {k: int(v) for k, v in m.groupdict().items() if v is not None}
+    # Scan number-unit terms directly rather than through the regex
+    # engine: digits, optional whitespace, a unit word, repeated until
+    # the text is consumed. Anything else is a parse error.
+    td_args: Dict[str, int] = {}
+    last_rank = -1
+    pos = 0
+    length = len(text)
+    while pos < length:
+        while pos < length and text[pos].isspace():
+            pos += 1
+        if pos == length:
+            break
+        digits_start = pos
+        while pos < length and text[pos].isdigit():
+            pos += 1
+        if pos == digits_start:
+            raise ValueError(f"Could not parse a timespan from {text!r}.")
+        value = int(text[digits_start:pos])
+        while pos < length and text[pos].isspace():
+            pos += 1
+        unit_start = pos
+        while pos < length and text[pos].isalpha():
+            pos += 1
+        try:
+            unit = _timespan_units[text[unit_start:pos]]
+        except KeyError:
+            raise ValueError(f"Could not parse a timespan from {text!r}.")
+        rank = _timespan_unit_ranks[unit]
+        if rank <= last_rank:
+            # A repeated or out-of-order unit is a parse error rather
+            # than silently overwriting an earlier term.
+            raise ValueError(f"Could not parse a timespan from {text!r}.")
+        last_rank = rank
+        td_args[unit] = value
     return datetime.timedelta(**td_args)
 
 
@@ -79,18 +288,83 @@ class BroadcastMarkdown:
 
     def __init__(self, text: str, identifier: str) -> None:
         self._text = text
-        self.identifier = identifier
+        self.identifier = sys.intern(identifier)
         self._md_env: Dict[Any, Any] = {}
-        self._md_tokens = md.parse(text, self._md_env)
+        self._md_tokens: Optional[List[Token]] = None
         self._metadata = self._parse_metadata()
+        self._body: Optional[str] = None
+        self._body_rendered = False
+
+    @property
+    def _tokens(self) -> List[Token]:
+        """The markdown token stream, parsed on first use."""
+        if self._md_tokens is None:
+            self._md_tokens = md.parse(self._text, self._md_env)
+        return self._md_tokens
+
+    @classmethod
+    def load_many(cls, paths: Sequence[Path]) -> List[BroadcastMarkdown]:
+        """Load and parse several broadcast markdown files concurrently.
+
+        Files are read and parsed in a thread pool so that a batch load
+        (such as bootstrapping from a directory of messages) overlaps
+        file I/O instead of processing one file at a time. Each message's
+        identifier is the file's name.
+
+        Parameters
+        ----------
+        paths : sequence of `pathlib.Path`
+            Paths of the markdown files to load.
+
+        Returns
+        -------
+        `list` of `BroadcastMarkdown`
+            The parsed broadcasts, in the same order as ``paths``.
+        """
+        if not paths:
+            return []
+
+        def _load(path: Path) -> BroadcastMarkdown:
+            return cls(path.read_text(), path.name)
+
+        max_workers = min(16, (os.cpu_count() or 1) * 2, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_load, paths))
 
     def _parse_metadata(self) -> BroadcastMarkdownFrontMatter:
-        frontmatter_token = self._get_front_matter_token()
-        yaml_data = yaml.safe_load(frontmatter_token.content)
+        yaml_data = yaml.load(self._front_matter_source, Loader=_YamlLoader)
         return BroadcastMarkdownFrontMatter.parse_obj(yaml_data)
 
+    @property
+    def _front_matter_source(self) -> str:
+        """The YAML source of the front matter.
+
+        The common delimiter layout (an opening ``---`` line closed by
+        another) is found with a plain string scan, so a message that
+        metadata rules out -- for example, one targeting another
+        environment -- never pays for markdown tokenization. Unusual
+        layouts fall back to the tokenizer, whose result is shared with
+        later body rendering.
+        """
+        text = self._text
+        if text.startswith("---\n"):
+            # Scan line-wise for the closing fence. The tokenizer accepts
+            # a closing ``---`` with trailing whitespace, so the fast
+            # path must as well; otherwise it could latch onto a later
+            # thematic break in the body.
+            pos = 4
+            while True:
+                newline = text.find("\n", pos)
+                line = text[pos:] if newline == -1 else text[pos:newline]
+                if line.rstrip() == "---":
+                    return text[4 : pos - 1] if pos > 4 else ""
+                if newline == -1:
+                    break
+                pos = newline + 1
+        return self._get_front_matter_token().content
+
     def _get_front_matter_token(self) -> Token:
-        for token in self._md_tokens:
+        for token in self._tokens:
             if token.type == "front_matter":
                 return token
         raise ValueError(
@@ -111,12 +385,18 @@ class BroadcastMarkdown:
     def body(self) -> Optional[str]:
         """The text of the markdown body or `None` if the message doesn't have
         body content.
+
+        The body is rendered from the token stream on first access and
+        cached; the tokens don't change after parsing.
         """
-        body_tokens = [t for t in self._md_tokens if t.type != "front_matter"]
-        if len(body_tokens) == 0:
-            return None
-        else:
-            return MDRenderer().render(body_tokens, md.options, self._md_env)
+        if not self._body_rendered:
+            body_tokens = [t for t in self._tokens if t.type != "front_matter"]
+            if body_tokens:
+                self._body = md_renderer.render(
+                    body_tokens, md.options, self._md_env
+                )
+            self._body_rendered = True
+        return self._body
 
     def is_relevant_to_env(self, env_name: str) -> bool:
         """Determine if this broadcast message is relevant to the given
@@ -198,10 +478,28 @@ class BroadcastMarkdown:
 
             new_body = self.body
 
+        # Single-paragraph summaries (the common case) are rendered
+        # inline, skipping the wrapping <p> tags. Summaries with any
+        # other block structure (headings, lists, multiple paragraphs)
+        # go through the block renderer.
+        if not is_inline_renderable(new_summary):
+            if new_body is not None:
+                summary_html, body_html = render_gfm_many(
+                    [new_summary, new_body]
+                )
+            else:
+                summary_html = render_gfm(new_summary)
+                body_html = None
+        else:
+            summary_html = render_gfm(new_summary, inline=True)
+            body_html = render_gfm(new_body) if new_body is not None else None
+
         return BroadcastMessage(
             identifier=self.identifier,
             summary_md=new_summary,
             body_md=new_body,
+            summary_html=summary_html,
+            body_html=body_html,
             scheduler=self._make_scheduler(),
             enabled=self.metadata.enabled,
             category=self.metadata.category,
@@ -237,10 +535,59 @@ class BroadcastMarkdown:
                         rset.exrule(rule.to_rrule())
                     else:
                         rset.rrule(rule.to_rrule())
+            nth_weekday = self._match_monthly_nth_weekday()
+            if nth_weekday is not None:
+                return MonthlyNthWeekdayScheduler(
+                    rruleset=rset,
+                    ttl=self.metadata.ttl,
+                    weekday=nth_weekday[0],
+                    index=nth_weekday[1],
+                )
             return RecurringScheduler(rruleset=rset, ttl=self.metadata.ttl)
         else:
             return PermaScheduler()
 
+    def _match_monthly_nth_weekday(self) -> Optional[Tuple[int, int]]:
+        """Check whether the recurrence rules describe an unbounded "nth
+        weekday of every month" schedule.
+
+        Returns
+        -------
+        `tuple` or `None`
+            The ``(weekday, index)`` arguments for
+            `~semaphore.broadcast.models.MonthlyNthWeekdayScheduler`, or
+            `None` if the rules don't match that shape.
+        """
+        if self.metadata.rules is None or len(self.metadata.rules) != 1:
+            return None
+        rule = self.metadata.rules[0]
+        if (
+            rule.date is not None
+            or rule.freq != FreqEnum.monthly
+            or rule.interval != 1
+            or rule.exclude
+            or rule.start is None
+            or rule.end is not None
+            or rule.count is not None
+            or rule.week_start is not None
+            or rule.by_set_position is not None
+            or rule.by_month is not None
+            or rule.by_month_day is not None
+            or rule.by_year_day is not None
+            or rule.by_week is not None
+            or rule.by_hour is not None
+            or rule.by_minute is not None
+            or rule.by_second is not None
+        ):
+            return None
+        if rule.by_weekday is None or len(rule.by_weekday) != 1:
+            return None
+        by_weekday = rule.by_weekday[0]
+        if by_weekday.index is None or not 1 <= abs(by_weekday.index) <= 5:
+            return None
+        weekday = by_weekday.day.to_rrule_weekday().weekday
+        return (weekday, by_weekday.index)
+
 
 class FreqEnum(str, enum.Enum):
     """An enumeration of frequency labels for RecurringRule."""
@@ -629,9 +976,9 @@ class BroadcastMarkdownFrontMatter(BaseModel):
         if present, into individual rules items, if present, and if those
         items do not already have a non-None timezone.
         """
-        if "timezone" in values.keys():
+        if "timezone" in values:
             default_tz = values["timezone"]
-            if "rules" in values.keys():
+            if "rules" in values:
                 for r in values["rules"]:
                     if r.get("timezone") is None:
                         r["timezone"] = default_tz
@@ -746,7 +1093,7 @@ def convert_to_tzinfo(v: Any) -> datetime.tzinfo:
     if isinstance(v, datetime.tzinfo):
         return v
     elif isinstance(v, str):
-        tz = dateutil.tz.gettz(v)
+        tz = _gettz(v)
         if not isinstance(tz, datetime.tzinfo):
             raise ValueError(f"Could not parse timezone from {v!s}")
         return tz
@@ -782,19 +1129,26 @@ def convert_to_arrow(v: Any, default_tz: Optional[Any] = None) -> arrow.Arrow:
         dt = v
     elif isinstance(v, str):
         try:
-            dt = dateutil.parser.parse(v, fuzzy=True, yearfirst=True)
-        except (ValueError, OverflowError):
-            raise ValueError("Could not parse date")
+            # Fast path: ISO 8601 timestamps (the documented format for
+            # broadcast files) parse without dateutil's format inference.
+            dt = datetime.datetime.fromisoformat(v)
+        except ValueError:
+            try:
+                dt = dateutil.parser.parse(v, fuzzy=True, yearfirst=True)
+            except (ValueError, OverflowError):
+                raise ValueError("Could not parse date")
     else:
         raise TypeError(f"Not a string (got {v!r})")
 
+    # Normalize to UTC so downstream scheduling arithmetic compares
+    # like-timezone values without converting on every comparison.
     if dt.tzinfo:
         # Parsed date includes a timezone.
-        return arrow.get(dt)
+        return arrow.get(dt).to("utc")
     else:
         # naive datetime, so default to given timezone
         if default_tz:
-            return arrow.get(dt, default_tz)
+            return arrow.get(dt, default_tz).to("utc")
         else:
             return arrow.get(dt, dateutil.tz.UTC)
 
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import bisect
+import calendar
+import datetime
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 import arrow
 
 if TYPE_CHECKING:
-    import datetime
-    from typing import Optional, Tuple
+    from typing import Iterator, Tuple, Union
 
     import dateutil.rrule
 
@@ -21,12 +26,70 @@ __all__ = [
     "Scheduler",
     "PermaScheduler",
     "RecurringScheduler",
+    "MonthlyNthWeekdayScheduler",
     "OneTimeScheduler",
     "OpenEndedScheduler",
     "FixedExpirationScheduler",
     "BroadcastCategory",
+    "evaluation_scope",
 ]
 
+_evaluation_now: ContextVar[Optional[arrow.Arrow]] = ContextVar(
+    "_evaluation_now", default=None
+)
+"""The pinned "now" for the current evaluation scope, if one is open."""
+
+
+@contextmanager
+def evaluation_scope() -> Iterator[None]:
+    """Pin the current time for the duration of a scheduling evaluation.
+
+    Inside the scope, every scheduler query (`Scheduler.is_active`,
+    `Scheduler.has_future_events`, and so on) sees the same "now", so a
+    pass over many messages makes one clock read instead of one per
+    comparison, and all messages in the pass are judged against a
+    consistent instant.
+
+    The scope must not span a generator ``yield``: the pinned time is
+    stored in a `~contextvars.ContextVar`, so a suspended generator
+    would leak it into the caller's context. Evaluate the pass eagerly
+    inside the scope instead.
+    """
+    token = _evaluation_now.set(arrow.utcnow())
+    try:
+        yield
+    finally:
+        _evaluation_now.reset(token)
+
+
+def _now() -> arrow.Arrow:
+    """Get the current time, honoring an open `evaluation_scope`."""
+    now = _evaluation_now.get()
+    if now is None:
+        return arrow.utcnow()
+    return now
+
+
+_ONE_SECOND = datetime.timedelta(seconds=1)
+"""A one-second step, used when probing past the current event."""
+
+_OCCURRENCE_WINDOW_PAST = datetime.timedelta(days=7)
+"""How far before "now minus the TTL" the pre-expanded occurrence window
+of a `RecurringScheduler` reaches.
+"""
+
+_OCCURRENCE_WINDOW_FUTURE = datetime.timedelta(days=30)
+"""How far into the future the pre-expanded occurrence window of a
+`RecurringScheduler` reaches.
+"""
+
+
+def _now_ts() -> float:
+    """Get the current POSIX timestamp, honoring an open
+    `evaluation_scope`.
+    """
+    return _now().timestamp()
+
 
 class BroadcastCategory(str, Enum):
     """Broadcast message categories."""
@@ -41,6 +104,8 @@ class BroadcastCategory(str, Enum):
 class Scheduler(ABC):
     """A scheduler for messages."""
 
+    __slots__ = ()
+
     @abstractmethod
     def is_active(self) -> bool:
         """Tests if the scheduled event is active."""
@@ -59,6 +124,18 @@ class Scheduler(ABC):
 class PermaScheduler(Scheduler):
     """A scheduler that is always active."""
 
+    __slots__ = ()
+
+    _instance: ClassVar[Optional[PermaScheduler]] = None
+
+    def __new__(cls) -> PermaScheduler:
+        # The scheduler is stateless, so every constructor call can
+        # return the same object; most broadcast messages use this
+        # scheduler.
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def is_active(self) -> bool:
         return True
 
@@ -66,38 +143,55 @@ class PermaScheduler(Scheduler):
         return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixedExpirationScheduler(Scheduler):
     """A scheduler that is active from now until a fixed date."""
 
     end: arrow.Arrow
     """The end date."""
 
+    _end_ts: float = field(init=False, repr=False, compare=False)
+    """The end date as a POSIX timestamp, precomputed so that activity
+    checks compare floats instead of datetime objects.
+    """
+
+    def __post_init__(self) -> None:
+        # Frozen dataclasses assign through object.__setattr__.
+        object.__setattr__(self, "_end_ts", self.end.timestamp())
+
     def is_active(self) -> bool:
-        return arrow.utcnow() < self.end
+        return _now_ts() < self._end_ts
 
     def has_future_events(self) -> bool:
         return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenEndedScheduler(Scheduler):
     """A scheduler that has a fixed start time, but no end time."""
 
     start: arrow.Arrow
     """The start date."""
 
+    _start_ts: float = field(init=False, repr=False, compare=False)
+    """The start date as a POSIX timestamp, precomputed so that activity
+    checks compare floats instead of datetime objects.
+    """
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_start_ts", self.start.timestamp())
+
     def is_active(self) -> bool:
-        return arrow.utcnow() >= self.start
+        return _now_ts() >= self._start_ts
 
     def has_future_events(self) -> bool:
-        if arrow.utcnow() < self.start:
+        if _now_ts() < self._start_ts:
             return True
         else:
             return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OneTimeScheduler(Scheduler):
     """A scheduler for a single, fixed, time window."""
 
@@ -107,6 +201,12 @@ class OneTimeScheduler(Scheduler):
     end: arrow.Arrow
     """The end date."""
 
+    _start_ts: float = field(init=False, repr=False, compare=False)
+    """The start date as a POSIX timestamp."""
+
+    _end_ts: float = field(init=False, repr=False, compare=False)
+    """The end date as a POSIX timestamp."""
+
     @classmethod
     def from_ttl(
         cls, start: arrow.Arrow, ttl: datetime.timedelta
@@ -128,11 +228,15 @@ class OneTimeScheduler(Scheduler):
         end = start.shift(seconds=ttl.total_seconds())
         return cls(start, end)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_start_ts", self.start.timestamp())
+        object.__setattr__(self, "_end_ts", self.end.timestamp())
+
     def is_active(self) -> bool:
-        return arrow.utcnow().is_between(self.start, self.end, bounds="[)")
+        return self._start_ts <= _now_ts() < self._end_ts
 
     def has_future_events(self) -> bool:
-        if self.start > arrow.utcnow():
+        if self._start_ts > _now_ts():
             return True
         else:
             return False
@@ -152,16 +256,46 @@ class RecurringScheduler(Scheduler):
         The duration of the event.
     """
 
+    __slots__ = (
+        "rruleset",
+        "ttl",
+        "_start",
+        "_series_end",
+        "_propose_cache",
+        "_window",
+        "_occurrences",
+    )
+
     def __init__(
         self, rruleset: dateutil.rrule.rruleset, ttl: datetime.timedelta
     ) -> None:
         self.rruleset = rruleset
         self.ttl = ttl
+        self._propose_cache: Optional[
+            Tuple[
+                datetime.datetime,
+                Optional[Tuple[datetime.datetime, datetime.datetime]],
+            ]
+        ] = None
+
+        # Pre-expand the occurrences around the present so that most
+        # queries are answered with a bisection of a sorted tuple rather
+        # than a rule-set expansion. Queries outside the window fall back
+        # to the rule set. The window is fixed at construction; the
+        # repository replaces schedulers when messages are re-ingested.
+        now_datetime = _now().datetime
+        self._window = (
+            now_datetime - ttl - _OCCURRENCE_WINDOW_PAST,
+            now_datetime + _OCCURRENCE_WINDOW_FUTURE,
+        )
+        self._occurrences = tuple(
+            rruleset.between(self._window[0], self._window[1], inc=True)
+        )
 
         # Get the next start date from now (but rewinding by the ttl in case
         # the message is active **right now**.
-        start_datetime = rruleset.after(
-            arrow.utcnow().shift(seconds=-ttl.total_seconds()).datetime,
+        start_datetime = self._next_occurrence(
+            _now().shift(seconds=-ttl.total_seconds()).datetime,
             inc=True,
         )
         if start_datetime is None:
@@ -169,13 +303,46 @@ class RecurringScheduler(Scheduler):
             # OneTimeScheduler, try to build the scheduler with an already-old
             # start.
             start_datetime = rruleset.before(
-                arrow.utcnow().shift(seconds=-ttl.total_seconds()).datetime,
+                _now().shift(seconds=-ttl.total_seconds()).datetime,
                 inc=True,
             )
             if start_datetime is None:
                 # Could this rruleset ever be scheduled?
                 raise ValueError(f"Cannot schedule rruleset: {rruleset!r}")
-        self._start = arrow.get(start_datetime)
+        # Scheduling state is kept as plain (timezone-aware) datetimes;
+        # the rule set produces datetimes directly, and comparing them
+        # avoids wrapping each occurrence in an Arrow object. Arrow
+        # instances still compare transparently against them.
+        self._start = start_datetime
+        self._series_end = self._compute_series_end()
+
+    def _compute_series_end(self) -> Optional[datetime.datetime]:
+        """Compute an upper bound on the start of the last occurrence in
+        the rule set, or `None` if the series is unbounded.
+
+        A rule bounded by a count is expanded to its final occurrence; a
+        rule bounded by an until date uses that date as the bound.
+        Exclusion rules and dates only remove occurrences, so the result
+        remains a valid upper bound without considering them. Knowing the
+        bound lets scheduling queries answer "no more events" without
+        consulting the rule set at all.
+        """
+        # rruleset has no public accessor for its component rules and
+        # dates.
+        last: Optional[datetime.datetime] = None
+        for rule in self.rruleset._rrule:  # type: ignore[attr-defined]
+            if rule._count is not None:
+                rule_last = rule[rule._count - 1]
+            elif rule._until is not None:
+                rule_last = rule._until
+            else:
+                return None
+            if last is None or rule_last > last:
+                last = rule_last
+        for rdate in self.rruleset._rdate:  # type: ignore[attr-defined]
+            if last is None or rdate > last:
+                last = rdate
+        return last
 
     @property
     def ttl_seconds(self) -> float:
@@ -183,23 +350,28 @@ class RecurringScheduler(Scheduler):
         return self.ttl.total_seconds()
 
     @property
-    def _end(self) -> arrow.Arrow:
+    def _end(self) -> datetime.datetime:
         """The end time of the current event."""
-        return self._start.shift(seconds=self.ttl_seconds)
+        return self._start + self.ttl
 
     def is_active(self) -> bool:
         self._refresh()
-        return arrow.utcnow().is_between(self._start, self._end, bounds="[)")
+        now = _now()
+        return self._start <= now < self._end
 
     def has_future_events(self) -> bool:
-        now = arrow.utcnow()
+        now = _now()
+        if self._series_end is not None and now >= self._series_end:
+            # The series is bounded and its last occurrence has already
+            # started, so no further event can begin.
+            return False
         if now < self._start:
             # Next event is already scheduled
             return True
         elif self.is_active():
             # Currently active, determine if there will be a future event
             try:
-                self._propose(self._start.shift(seconds=1))
+                self._propose(self._start + _ONE_SECOND)
             except ValueError:
                 return False
             return True
@@ -213,13 +385,20 @@ class RecurringScheduler(Scheduler):
                 return True
 
     def _refresh(self) -> None:
-        if self._end < arrow.utcnow():
+        if (
+            self._series_end is not None
+            and self._series_end + self.ttl < _now()
+        ):
+            # Even the last possible occurrence has expired; there is
+            # nothing to advance to, so skip querying the rule set.
+            return None
+        if self._end < _now():
             # The last message occurence expired, so let's calculate the next.
             try:
                 candidate_start, candidate_end = self._propose(self._start)
             except ValueError:
                 return None  # no future event
-            while candidate_end < arrow.utcnow():
+            while candidate_end < _now():
                 # Keep iterating in case windows overlap
                 try:
                     candidate_start, candidate_end = self._propose(
@@ -230,25 +409,141 @@ class RecurringScheduler(Scheduler):
             # Set next start date
             self._start = candidate_start
 
-    def _propose(self, after: arrow.Arrow) -> Tuple[arrow.Arrow, arrow.Arrow]:
+    def _propose(
+        self, after: Union[datetime.datetime, arrow.Arrow]
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
         """Propose a new start/end time after the given time.
 
+        The rule set never changes after construction, so the answer for
+        a given ``after`` is memoized; repeated queries (such as
+        `has_future_events` probing past the current event) skip the rule
+        set entirely.
+
         Raises
         ------
         ValueError
             Raised if a start/end time can't be proposed based on the
             rule set.
         """
-        candidate_start = self.rruleset.after(after, inc=False)
-        if candidate_start is None:
-            raise ValueError
+        if isinstance(after, arrow.Arrow):
+            after = after.datetime
+        cached = self._propose_cache
+        if cached is not None and cached[0] == after:
+            result = cached[1]
         else:
-            candidate_start = arrow.get(candidate_start)
-        candidate_end = candidate_start.shift(seconds=self.ttl_seconds)
-        return (candidate_start, candidate_end)
+            start = self._next_occurrence(after, inc=False)
+            if start is None:
+                result = None
+            else:
+                result = (start, start + self.ttl)
+            self._propose_cache = (after, result)
+        if result is None:
+            raise ValueError
+        return result
+
+    def _next_occurrence(
+        self, after: datetime.datetime, inc: bool = False
+    ) -> Optional[datetime.datetime]:
+        """Get the next occurrence in the series strictly after the given
+        datetime (or at it, when ``inc`` is set), or `None` if there is
+        none.
+
+        The base implementation bisects the pre-expanded occurrence
+        window when the query falls inside it, and queries the rule set
+        otherwise; subclasses for specific recurrence shapes can override
+        this with a closed-form computation.
+        """
+        window_start, window_end = self._window
+        if window_start <= after <= window_end:
+            if inc:
+                index = bisect.bisect_left(self._occurrences, after)
+            else:
+                index = bisect.bisect_right(self._occurrences, after)
+            if index < len(self._occurrences):
+                return self._occurrences[index]
+            # The next occurrence (if any) is beyond the window.
+        return self.rruleset.after(after, inc=inc)
+
 
+class MonthlyNthWeekdayScheduler(RecurringScheduler):
+    """A recurring schedule for the nth weekday of every month (such as
+    "the third Thursday").
 
-@dataclass
+    This common recurrence shape can be computed in closed form with the
+    `calendar` module, so occurrence queries don't need to expand the
+    rule set. The rule set is still kept for fallback paths such as
+    computing the series bound.
+
+    Parameters
+    ----------
+    rruleset : `dateutil.rrule.rruleset`
+        The recurrence rule set; see `RecurringScheduler`. It must
+        describe the same schedule as ``weekday`` and ``index``, with a
+        timezone-aware ``dtstart``.
+    ttl : `datetime.timedela`
+        The duration of the event.
+    weekday : `int`
+        The day of the week, where Monday is ``0`` (matching both the
+        `calendar` module and ``dateutil.rrule.weekday.weekday``).
+    index : `int`
+        The index of the weekday within the month: ``1`` is the first,
+        ``-1`` the last. The magnitude must be 5 or less.
+    """
+
+    __slots__ = ("_weekday", "_index", "_dtstart")
+
+    def __init__(
+        self,
+        rruleset: dateutil.rrule.rruleset,
+        ttl: datetime.timedelta,
+        *,
+        weekday: int,
+        index: int,
+    ) -> None:
+        self._weekday = weekday
+        self._index = index
+        # rruleset has no public accessor for its component rules.
+        first_rule = rruleset._rrule[0]  # type: ignore[attr-defined]
+        self._dtstart = first_rule._dtstart
+        super().__init__(rruleset=rruleset, ttl=ttl)
+
+    def _nth_weekday_of_month(self, year: int, month: int) -> Optional[int]:
+        """Get the day of the month for the nth weekday, or `None` if the
+        month doesn't have that many of the weekday.
+        """
+        weeks = calendar.monthcalendar(year, month)
+        days = [week[self._weekday] for week in weeks if week[self._weekday]]
+        if self._index > 0:
+            if self._index <= len(days):
+                return days[self._index - 1]
+        elif -self._index <= len(days):
+            return days[self._index]
+        return None
+
+    def _next_occurrence(
+        self, after: datetime.datetime, inc: bool = False
+    ) -> Optional[datetime.datetime]:
+        search = after if after >= self._dtstart else self._dtstart
+        year = search.year
+        month = search.month
+        while True:
+            day = self._nth_weekday_of_month(year, month)
+            if day is not None:
+                occurrence = self._dtstart.replace(
+                    year=year, month=month, day=day
+                )
+                if occurrence >= self._dtstart and (
+                    occurrence > after or (inc and occurrence == after)
+                ):
+                    return occurrence
+            if month == 12:
+                year += 1
+                month = 1
+            else:
+                month += 1
+
+
+@dataclass(slots=True)
 class BroadcastMessage:
     """A broadcast message, including its content and schedule."""
 
@@ -274,6 +569,20 @@ class BroadcastMessage:
     - `FixedExpirationScheduler`
     """
 
+    summary_html: Optional[str] = None
+    """The summary, pre-rendered as HTML.
+
+    Rendering happens once at ingest time (see
+    `semaphore.broadcast.markdown.BroadcastMarkdown.to_broadcast`) so that
+    serving the message doesn't require rendering markdown on every
+    request.
+    """
+
+    body_html: Optional[str] = None
+    """The body content, pre-rendered as HTML (`None` if the message
+    doesn't have body content).
+    """
+
     enabled: bool = True
     """A toggle for disabling a message, overriding the scheduler."""
 
@@ -282,6 +591,12 @@ class BroadcastMessage:
     ``maintenance``.
     """
 
+    def __post_init__(self) -> None:
+        # Identifiers recur as repository keys, cache keys, and response
+        # payload values; interning them makes those dict lookups and
+        # equality checks pointer comparisons.
+        self.identifier = sys.intern(self.identifier)
+
     @property
     def active(self) -> bool:
         """Whether the message should be served to clients for display.
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, Set
+
+from .models import PermaScheduler, evaluation_scope
 
 if TYPE_CHECKING:
     from .models import BroadcastMessage
@@ -32,10 +34,22 @@ class BroadcastMessageRepository:
         self, messages: Optional[Sequence[BroadcastMessage]] = None
     ) -> None:
         self._messages: Dict[str, BroadcastMessage] = {}
+        self._always_active: Set[str] = set()
+        self._generation = 0
         if messages is not None:
             for message in messages:
                 self.add(message)
 
+    @property
+    def generation(self) -> int:
+        """A counter that increments every time the repository's content
+        changes.
+
+        Callers can compare generations to cheaply detect whether messages
+        have been added, replaced, or removed since a previous observation.
+        """
+        return self._generation
+
     def add(self, message: BroadcastMessage) -> None:
         """Add a message into the repository, or replace an existing message
         of same identifier.
@@ -46,9 +60,18 @@ class BroadcastMessageRepository:
             Description
         """
         self._messages[message.identifier] = message
+        # Index the messages whose scheduler can never deactivate them, so
+        # that active-message queries skip their scheduler entirely. The
+        # index is maintained here and in remove/clear; messages are
+        # replaced through add rather than mutated in place.
+        if message.enabled and isinstance(message.scheduler, PermaScheduler):
+            self._always_active.add(message.identifier)
+        else:
+            self._always_active.discard(message.identifier)
+        self._generation += 1
 
     def __contains__(self, identifier: str) -> bool:
-        return identifier in self._messages.keys()
+        return identifier in self._messages
 
     def __getitem__(self, identifier: str) -> BroadcastMessage:
         """Get an item based on a message's identifier.
@@ -103,33 +126,58 @@ class BroadcastMessageRepository:
     def iter_active(self) -> Iterator[BroadcastMessage]:
         """Iterate over messages that are currently active (based on their
         scheduler.
+
+        All messages in the pass are evaluated against the same "now".
         """
-        for message in self.iter():
-            if message.active:
-                yield message
+        always_active = self._always_active
+        # Evaluate eagerly inside the scope: a scope spanning generator
+        # yields would leak the pinned "now" into the caller's context
+        # between iterations.
+        with evaluation_scope():
+            active = [
+                message
+                for message in self.iter()
+                if message.identifier in always_active or message.active
+            ]
+        return iter(active)
 
     def iter_stale(self) -> Iterator[BroadcastMessage]:
         """Iterate over messages that are considered stale (they are not
         active and will not be scheduled in the future.
+
+        All messages in the pass are evaluated against the same "now".
         """
-        for message in self.iter():
-            if message.stale:
-                yield message
+        with evaluation_scope():
+            stale = [message for message in self.iter() if message.stale]
+        return iter(stale)
 
     def iter_pending(self) -> Iterator[BroadcastMessage]:
         """Iterate over messages that have pending future events, but
         is not currently active.
+
+        All messages in the pass are evaluated against the same "now".
         """
-        for message in self.iter():
-            if message.scheduler.has_future_events():
-                yield message
+        with evaluation_scope():
+            pending = [
+                message
+                for message in self.iter()
+                if message.scheduler.has_future_events()
+            ]
+        return iter(pending)
+
+    def clear(self) -> None:
+        """Remove all messages from the repository."""
+        if self._messages:
+            self._messages.clear()
+            self._always_active.clear()
+            self._generation += 1
 
     def remove(self, identifier: str, raise_if_missing: bool = False) -> None:
         """Remove the message."""
-        try:
-            del self._messages[identifier]
-        except KeyError:
-            if raise_if_missing:
-                raise NotFoundError(
-                    f"{identifier} is not in the broadcast message repository"
-                )
+        if self._messages.pop(identifier, None) is not None:
+            self._always_active.discard(identifier)
+            self._generation += 1
+        elif raise_if_missing:
+            raise NotFoundError(
+                f"{identifier} is not in the broadcast message repository"
+            )
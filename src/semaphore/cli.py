@@ -7,10 +7,27 @@ from typing import TYPE_CHECKING
 import click
 
 if TYPE_CHECKING:
-    from typing import Union
+    from typing import Dict, Optional, Tuple, Union
 
 __all__ = ["main", "help"]
 
+_help_cache: Dict[Tuple[str, Optional[str]], str] = {}
+"""Cache of rendered help text, keyed by topic and invocation name.
+
+The command tree is fixed once the module is imported, so each topic's
+help only needs to be formatted once per process.
+"""
+
+
+def _render_help(topic: str, ctx: click.Context) -> str:
+    """Render (and cache) the help text for a subcommand."""
+    key = (topic, ctx.info_name)
+    text = _help_cache.get(key)
+    if text is None:
+        text = main.commands[topic].get_help(ctx)
+        _help_cache[key] = text
+    return text
+
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(message="%(version)s")
@@ -31,7 +48,7 @@ def help(ctx: click.Context, topic: Union[None, str]) -> None:
     # https://www.burgundywall.com/post/having-click-help-subcommand
     if topic:
         if topic in main.commands:
-            click.echo(main.commands[topic].get_help(ctx))
+            click.echo(_render_help(topic, ctx))
         else:
             raise click.UsageError(f"Unknown help topic {topic}", ctx)
     else:
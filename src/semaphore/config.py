@@ -73,6 +73,18 @@ class Config(BaseSettings):
     manually toggled to False if necessary.
     """
 
+    enable_compiled_markdown: bool = Field(
+        False, env="SEMAPHORE_COMPILED_MARKDOWN"
+    )
+    """Toggle to render broadcast HTML with the compiled cmarkgfm renderer
+    instead of markdown-it-py.
+
+    cmarkgfm binds the libcmark-gfm C library and renders the same GFM
+    dialect considerably faster. The toggle only takes effect if the
+    cmarkgfm package is installed; otherwise rendering falls back to
+    markdown-it-py.
+    """
+
     phalanx_env: str = Field(..., env="SEMAPHORE_PHALANX_ENV")
     """Name of the Phalanx environment this Semaphore installation is running
     in (e.g. ``idfprod``).
@@ -33,6 +33,8 @@ if TYPE_CHECKING:
     from sempaphore.broadcast.repository import BroadcastMessageRepository
     from structlog.stdlib import BoundLogger
 
+    from .client import GitHubClient
+
 
 BROADCASTS_DIR = "broadcasts"
 """Directory relative to a GitHub repository's root that contains broadcast
@@ -89,7 +91,7 @@ async def update_broadcast_repo_from_push_event(
     *,
     event: Event,
     broadcast_repo: BroadcastMessageRepository,
-    github_client: GitHubAPI,
+    github_client: GitHubClient,
     logger: BoundLogger,
 ) -> None:
     """Updates messages in the repository based on a GitHub webhook for the
@@ -102,7 +104,7 @@ async def update_broadcast_repo_from_push_event(
         The parsed event payload.
     broadcast_repo : ``BroadcastMessageRepository``
         The broadcast message repository.
-    github_client : `gidgethub.httpx.GitHubAPI`
+    github_client : `semaphore.github.client.GitHubClient`
         The GitHub API client, pre-authorized as an app installation.
     logger
         The logger instance
@@ -118,7 +120,7 @@ async def update_broadcast_repo_from_push_event(
         files_removed=list(files_removed),
     )
 
-    for path in filter(is_broadcast_message, files_written):
+    for path in files_written:
         message_ref = GitHubMessageRef.from_push_event(path=path, event=event)
         try:
             await add_file_to_repository(
@@ -143,7 +145,7 @@ async def update_broadcast_repo_from_push_event(
         finally:
             continue
 
-    for path in filter(is_broadcast_message, files_removed):
+    for path in files_removed:
         message_id = GitHubMessageRef.from_push_event(
             path=path, event=event
         ).as_id()
@@ -159,25 +161,27 @@ def _integrate_file_changes_in_commits(
 ) -> Tuple[Set[str], Set[str]]:
     """Integrate the file changes from the sequence of individual commits
     to determine the overall set of added/modified and removed files.
+
+    Only broadcast message files (see `is_broadcast_message`) are tallied;
+    other paths are dropped before entering the set arithmetic so that a
+    large push touching many unrelated files doesn't inflate the sets.
     """
-    files_written = set()  # new or modified content
-    files_removed = set()  # deleted content
+    files_written: Set[str] = set()  # new or modified content
+    files_removed: Set[str] = set()  # deleted content
     for commit in commits:
-        commit_added = set(commit["added"])
-        commit_modified = set(commit["modified"])
-        commit_removed = set(commit["removed"])
-
-        # Update tally of modified files
-        files_written |= commit_added | commit_modified
-
-        # Update tally of removed files
-        files_removed |= commit_removed
-
-        # Added files are not longer removed
-        files_removed -= commit_added
-
-        # Deleted files are no longer written
-        files_written -= commit_removed
+        for path in commit["added"]:
+            if is_broadcast_message(path):
+                files_written.add(path)
+                # Added files are no longer removed
+                files_removed.discard(path)
+        for path in commit["modified"]:
+            if is_broadcast_message(path):
+                files_written.add(path)
+        for path in commit["removed"]:
+            if is_broadcast_message(path):
+                files_removed.add(path)
+                # Deleted files are no longer written
+                files_written.discard(path)
     return files_written, files_removed
 
 
@@ -200,10 +204,11 @@ def is_broadcast_message(path: str) -> bool:
     if os.path.dirname(path) != BROADCASTS_DIR:
         return False
 
-    if os.path.splitext(path)[-1].lower() not in set([".md"]):
+    # A single rsplit + lower replaces the os.path.splitext/basename
+    # calls; this function runs for every path in a push event.
+    name = path.rsplit("/", 1)[-1].lower()
+    if not name.endswith(".md"):
         return False
-
-    name = os.path.basename(path).lower()
     if name.startswith("."):
         return False
     if name == "readme.md":
@@ -218,7 +223,7 @@ async def add_file_to_repository(
     message_ref: GitHubMessageRef,
     contents_url: str,
     broadcast_repo: BroadcastMessageRepository,
-    github_client: GitHubAPI,
+    github_client: GitHubClient,
     logger: BoundLogger,
 ) -> None:
     """Add/update a broadcast message in the repository from a file in a GitHub
@@ -235,7 +240,7 @@ async def add_file_to_repository(
         includs a ``path`` variable).
     broadcast_repo : ``BroadcastMessageRepository``
         The broadcast message repository.
-    github_client : `gidgethub.httpx.GitHubAPI`
+    github_client : `semaphore.github.client.GitHubClient`
         The GitHub API client, pre-authorized as an app installation.
     logger
         The logger instance
@@ -362,14 +367,14 @@ async def iter_installations(
 
 async def iter_installation_repositories(
     *,
-    github_client: GitHubAPI,
+    github_client: GitHubClient,
 ) -> AsyncIterator[Dict[str, Any]]:
     """Iterate over repositories that the GitHub app installation has access
     to.
 
     Parameters
     ----------
-    github_client : `gidgethub.httpx.GitHubAPI`
+    github_client : `semaphore.github.client.GitHubClient`
         The GitHub client that is pre-authorized with an installation ID,
         see `create_github_installation_client`.
 
@@ -389,13 +394,13 @@ async def iter_installation_repositories(
 
 
 async def iter_repo_dir_contents(
-    github_client: GitHubAPI, contents_url: str, directory_path: str
+    github_client: GitHubClient, contents_url: str, directory_path: str
 ) -> AsyncIterator[Dict[str, Any]]:
     """Iterate over content objects in a repository in a GitHub repository.
 
     Parameters
     ----------
-    github_client : `gidgethub.httpx.GitHubAPI`
+    github_client : `semaphore.github.client.GitHubClient`
         The GitHub client that is pre-authorized with an installation ID,
         see `create_github_installation_client`.
     contents_url : `str`
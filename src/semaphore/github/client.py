@@ -4,7 +4,18 @@ configuration.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import datetime
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import gidgethub.apps
 from gidgethub.httpx import GitHubAPI
@@ -12,10 +23,13 @@ from gidgethub.httpx import GitHubAPI
 from semaphore.config import config
 
 if TYPE_CHECKING:
+    import gidgethub.sansio
     import httpx.AsyncClient
 
 __all__ = [
+    "GitHubClient",
     "GitHubClientConfigError",
+    "RateLimitedGitHubAPI",
     "get_app_jwt",
     "create_github_installation_client",
 ]
@@ -25,6 +39,96 @@ class GitHubClientConfigError(Exception):
     """Raised if there is an error with the GitHub App's configuration."""
 
 
+_INSTALLATION_CLIENT_TTL = 50 * 60
+"""Lifetime (seconds) of a cached installation client.
+
+GitHub App installation tokens are valid for one hour; cached clients are
+discarded slightly earlier so that a cached token is never used close to
+its expiration.
+"""
+
+_installation_client_cache: Dict[
+    str, Tuple["RateLimitedGitHubAPI", float]
+] = {}
+"""Cache of installation clients, keyed by installation ID.
+
+Each value holds the client and the `time.monotonic` timestamp at which
+the cached entry expires.
+"""
+
+
+class RateLimitedGitHubAPI:
+    """A proxy around a GitHub API client that proactively throttles
+    requests when the rate limit budget runs low.
+
+    Rather than relying solely on catching
+    `~gidgethub.RateLimitExceeded` after the budget is exhausted, this
+    wrapper inspects the rate limit information that GitHub returns with
+    each response and, once the remaining budget drops below
+    ``min_remaining``, sleeps before each request so that the remaining
+    requests are spread evenly across the time left until the limit
+    resets.
+
+    Parameters
+    ----------
+    github_client : `gidgethub.httpx.GitHubAPI`
+        The GitHub API client to wrap.
+    min_remaining : `int`, optional
+        The remaining-request threshold below which requests are
+        throttled.
+    """
+
+    def __init__(
+        self, github_client: GitHubAPI, *, min_remaining: int = 100
+    ) -> None:
+        self._client = github_client
+        self._min_remaining = min_remaining
+
+    @property
+    def rate_limit(self) -> Optional[gidgethub.sansio.RateLimit]:
+        """The rate limit from the most recent GitHub response."""
+        return self._client.rate_limit
+
+    async def _throttle(self) -> None:
+        """Sleep before a request if the remaining rate limit budget is
+        below the threshold.
+        """
+        rate_limit = self._client.rate_limit
+        if rate_limit is None:
+            return
+        if rate_limit.remaining >= self._min_remaining:
+            return
+        now = datetime.datetime.now(datetime.timezone.utc)
+        seconds_to_reset = (rate_limit.reset_datetime - now).total_seconds()
+        if seconds_to_reset <= 0:
+            # The rate limit window has already reset.
+            return
+        # Spread the remaining budget evenly across the reset window.
+        await asyncio.sleep(seconds_to_reset / max(rate_limit.remaining, 1))
+
+    async def getitem(self, *args: Any, **kwargs: Any) -> Any:
+        await self._throttle()
+        return await self._client.getitem(*args, **kwargs)
+
+    async def getiter(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        await self._throttle()
+        async for item in self._client.getiter(*args, **kwargs):
+            yield item
+
+    async def post(self, *args: Any, **kwargs: Any) -> Any:
+        await self._throttle()
+        return await self._client.post(*args, **kwargs)
+
+
+GitHubClient = Union[GitHubAPI, RateLimitedGitHubAPI]
+"""Type alias for the GitHub API clients used by the GitHub services.
+
+Functions annotated with this alias accept either a plain
+`gidgethub.httpx.GitHubAPI` client or the rate-limited proxy returned by
+`create_github_installation_client`.
+"""
+
+
 def get_app_jwt() -> str:
     """Create the GitHub App's JWT based on application configuration.
 
@@ -84,7 +188,7 @@ def create_github_client(
 
 async def create_github_installation_client(
     *, http_client: httpx.AsyncClient, installation_id: str
-) -> GitHubAPI:
+) -> RateLimitedGitHubAPI:
     """Create a GitHub API client authorized as a GitHub App installation,
     with specific permissions on the repository/organization the app is
     installed into.
@@ -100,10 +204,23 @@ async def create_github_installation_client(
 
     Returns
     -------
-    gidgethub.httpx.GitHubAPI
+    RateLimitedGitHubAPI
         The GitHub client with an embedded OAuth token that authenticates
-        all requests as the GitHub app installation.
+        all requests as the GitHub app installation. The client is wrapped
+        in a `RateLimitedGitHubAPI` so that requests are throttled before
+        the installation's rate limit budget is exhausted.
+
+    Notes
+    -----
+    Installation tokens are valid for about an hour, so clients are cached
+    per installation ID and reused until shortly before the token expires.
+    This avoids re-signing the app JWT and re-requesting an installation
+    access token on every webhook delivery.
     """
+    cached = _installation_client_cache.get(installation_id)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
     token = get_app_jwt()
 
     if config.github_app_id is None:
@@ -127,4 +244,9 @@ async def create_github_installation_client(
 
     # Generate a new client with the embedded OAuth token.
     gh = create_github_client(http_client=http_client, oauth_token=token)
-    return gh
+    client = RateLimitedGitHubAPI(gh)
+    _installation_client_cache[installation_id] = (
+        client,
+        time.monotonic() + _INSTALLATION_CLIENT_TTL,
+    )
+    return client
@@ -2,33 +2,51 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from gidgethub.routing import Router
+from typing import TYPE_CHECKING
 
 from .broadcastservices import update_broadcast_repo_from_push_event
 
 if TYPE_CHECKING:
-    from gidgethub.httpx import GitHubAPI
     from gidgethub.sansio import Event
     from sempaphore.broadcast.repository import BroadcastMessageRepository
     from structlog.stdlib import BoundLogger
 
-__all__ = ["router"]
+    from .client import GitHubClient
+
+__all__ = ["dispatch", "handle_push_event"]
 
 
-router = Router()
-"""GitHub webhook router."""
+async def dispatch(
+    event: Event,
+    broadcast_repo: BroadcastMessageRepository,
+    github_client: GitHubClient,
+    logger: BoundLogger,
+) -> None:
+    """Dispatch a webhook event to its handler, if one is registered.
+
+    Events without a registered handler are silently ignored.
+
+    Parameters
+    ----------
+    event : `gidgethub.sansio.Event`
+        The parsed event payload.
+    broadcast_repo : ``BroadcastMessageRepository``
+        The broadcast message repository.
+    github_client : `semaphore.github.client.GitHubClient`
+        The GitHub API client, pre-authorized as an app installation.
+    logger
+        The logger instance
+    """
+    handler = _HANDLERS.get(event.event)
+    if handler is not None:
+        await handler(event, broadcast_repo, github_client, logger)
 
 
-@router.register("push")
 async def handle_push_event(
     event: Event,
     broadcast_repo: BroadcastMessageRepository,
-    github_client: GitHubAPI,
+    github_client: GitHubClient,
     logger: BoundLogger,
-    *args: Any,
-    **kwargs: Any,
 ) -> None:
     """Process ``push`` webhook events from GitHub.
 
@@ -38,7 +56,7 @@ async def handle_push_event(
         The parsed event payload.
     broadcast_repo : ``BroadcastMessageRepository``
         The broadcast message repository.
-    github_client : `gidgethub.httpx.GitHubAPI`
+    github_client : `semaphore.github.client.GitHubClient`
         The GitHub API client, pre-authorized as an app installation.
     logger
         The logger instance
@@ -54,3 +72,11 @@ async def handle_push_event(
             github_client=github_client,
             logger=logger,
         )
+
+
+_HANDLERS = {"push": handle_push_event}
+"""Mapping of webhook event names to their handlers.
+
+The mapping is built once at import time so that `dispatch` is a single
+dict lookup per webhook delivery.
+"""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Optional
 
 import httpx
 from fastapi import APIRouter, Depends, Request, Response, status
@@ -16,7 +17,7 @@ from semaphore.broadcast.repository import BroadcastMessageRepository
 from semaphore.config import config
 from semaphore.dependencies.broadcastrepo import broadcast_repo_dependency
 from semaphore.github.client import create_github_installation_client
-from semaphore.github.webhooks import router as webhook_router
+from semaphore.github.webhooks import dispatch as dispatch_webhook_event
 
 from .models import Index
 
@@ -28,6 +29,13 @@ router = APIRouter(prefix=f"/{config.name}")
 These routes have paths prefixed by the application name.
 """
 
+_index_cache: Optional[Index] = None
+"""Cached `Index` response, built on the first request.
+
+The index only contains package metadata and static configuration, so it
+is computed once per process rather than on every request.
+"""
+
 
 @router.get(
     "/",
@@ -52,17 +60,20 @@ async def get_index(
     ``metadata`` that provides the same Safir-generated metadata as the
     internal root endpoint.
     """
-    metadata = get_metadata(
-        package_name="semaphore",
-        application_name=config.name,
-    )
-    return Index(
-        metadata=metadata,
-        github_app_id=config.github_app_id,
-        github_app_enabled=config.enable_github_app,
-        api_docs_path=f"/{config.name}/docs",
-        openapi_path=f"/{config.name}/openapi.json",
-    )
+    global _index_cache
+    if _index_cache is None:
+        metadata = get_metadata(
+            package_name="semaphore",
+            application_name=config.name,
+        )
+        _index_cache = Index(
+            metadata=metadata,
+            github_app_id=config.github_app_id,
+            github_app_enabled=config.enable_github_app,
+            api_docs_path=f"/{config.name}/docs",
+            openapi_path=f"/{config.name}/openapi.json",
+        )
+    return _index_cache
 
 
 @router.post(
@@ -118,7 +129,7 @@ async def post_github_webhook(
     )
     # Give GitHub some time to reach internal consistency.
     await asyncio.sleep(1)
-    await webhook_router.dispatch(event, broadcast_repo, github_client, logger)
+    await dispatch_webhook_event(event, broadcast_repo, github_client, logger)
 
     logger.debug(
         "GH requests remaining",
@@ -26,3 +26,8 @@ class Index(BaseModel):
 
     openapi_path: str
     """Path to the web API's OpenAPI specification."""
+
+    class Config:
+        """Model configuration."""
+
+        allow_mutation = False
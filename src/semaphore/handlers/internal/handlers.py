@@ -14,6 +14,17 @@ __all__ = ["get_index"]
 
 router = APIRouter()
 
+_metadata = get_metadata(
+    package_name="semaphore",
+    application_name=config.name,
+)
+"""The application metadata, computed once at import time.
+
+The metadata only depends on the installed package and the static
+application configuration, so there is no need to recompute it on every
+request.
+"""
+
 
 @router.get(
     "/",
@@ -32,8 +43,4 @@ async def get_index() -> Metadata:
 
     By convention, this endpoint returns only the application's metadata.
     """
-    metadata = get_metadata(
-        package_name="semaphore",
-        application_name=config.name,
-    )
-    return metadata
+    return _metadata
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 
 from semaphore.broadcast.repository import BroadcastMessageRepository
 from semaphore.config import config
@@ -12,8 +14,25 @@ from semaphore.dependencies.broadcastrepo import broadcast_repo_dependency
 
 from .models import BroadcastMessageModel
 
-router = APIRouter(prefix=f"/{config.name}/v1")
-"""FastAPI router for all v1 REST API endpoints."""
+router = APIRouter(
+    prefix=f"/{config.name}/v1", default_response_class=ORJSONResponse
+)
+"""FastAPI router for all v1 REST API endpoints.
+
+Responses are encoded with orjson, which is substantially faster than the
+standard library encoder for the large nested payloads produced by the
+broadcast listing.
+"""
+
+_listing_cache: Optional[Tuple[Tuple[int, Tuple[str, ...]], bytes]] = None
+"""Cache of the serialized broadcast listing.
+
+Holds the cache key (the repository generation and the identifiers of the
+currently-active messages) alongside the encoded JSON bytes. The listing
+only changes when a message is added, replaced, or removed, or when a
+scheduler transitions a message in or out of the active set; between those
+events responses are served from the cached bytes without re-encoding.
+"""
 
 
 @router.get(
@@ -27,8 +46,19 @@ def get_broadcasts(
     broadcast_repo: BroadcastMessageRepository = Depends(
         broadcast_repo_dependency
     ),
-) -> List[BroadcastMessageModel]:
-    return [
-        BroadcastMessageModel.from_broadcast_message(m)
-        for m in broadcast_repo.iter_active()
-    ]
+) -> Response:
+    global _listing_cache
+    active_messages = list(broadcast_repo.iter_active())
+    cache_key = (
+        broadcast_repo.generation,
+        tuple(m.identifier for m in active_messages),
+    )
+    if _listing_cache is None or _listing_cache[0] != cache_key:
+        payload = orjson.dumps(
+            [
+                BroadcastMessageModel.from_broadcast_message(m).dict()
+                for m in active_messages
+            ]
+        )
+        _listing_cache = (cache_key, payload)
+    return Response(content=_listing_cache[1], media_type="application/json")
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
-from markdown_it import MarkdownIt
 from pydantic import BaseModel, Field
 
+from semaphore.broadcast.markdown import is_inline_renderable, render_gfm
 from semaphore.broadcast.models import BroadcastCategory, BroadcastMessage
 
 
+@lru_cache(maxsize=512)
+def _render(gfm_text: str, inline: bool) -> str:
+    """Render GitHub-flavored markdown to HTML, memoizing the result.
+
+    Rendering is delegated to `semaphore.broadcast.markdown.render_gfm`
+    so that all HTML output goes through the same renderer (including the
+    compiled-renderer toggle). Broadcast content changes rarely relative
+    to how often it is served, so repeated renders of the same text are
+    answered from the cache. The cache size bounds memory; entries for
+    replaced message text simply age out.
+    """
+    return render_gfm(gfm_text, inline=inline)
+
+
 class FormattedText(BaseModel):
     """Text that is formatted in both markdown and HTML."""
 
@@ -17,6 +32,9 @@ class FormattedText(BaseModel):
 
     html: str = Field(title="The HTML-formatted text.")
 
+    class Config:
+        allow_mutation = False
+
     @classmethod
     def from_gfm(cls, gfm_text: str, inline: bool = False) -> FormattedText:
         """Create formatted text from GitHub-flavored markdown.
@@ -33,12 +51,8 @@ class FormattedText(BaseModel):
         `FormattedText`
             The formatted text, containing both markdown and HTML renderings.
         """
-        md_parser = MarkdownIt("gfm-like")
-        if inline:
-            html_text = md_parser.renderInline(gfm_text)
-        else:
-            html_text = md_parser.render(gfm_text)
-        return cls(gfm=gfm_text, html=html_text)
+        # construct() skips validation; both values are known-good strings.
+        return cls.construct(gfm=gfm_text, html=_render(gfm_text, inline))
 
 
 class BroadcastMessageModel(BaseModel):
@@ -74,6 +88,9 @@ class BroadcastMessageModel(BaseModel):
 
     category: BroadcastCategory = Field(title="Category of the message.")
 
+    class Config:
+        allow_mutation = False
+
     @classmethod
     def from_broadcast_message(
         cls, message: BroadcastMessage
@@ -91,11 +108,28 @@ class BroadcastMessageModel(BaseModel):
         `BroadcastMessageModel`
             The message entity for the v1 API.
         """
-        formatted_summary = FormattedText.from_gfm(message.summary_md)
+        if message.summary_html is not None:
+            # Use HTML pre-rendered at ingest time rather than rendering
+            # markdown on every request.
+            formatted_summary = FormattedText.construct(
+                gfm=message.summary_md, html=message.summary_html
+            )
+        else:
+            formatted_summary = FormattedText.from_gfm(
+                message.summary_md,
+                inline=is_inline_renderable(message.summary_md),
+            )
         formatted_body = None
         if message.body_md is not None:
-            formatted_body = FormattedText.from_gfm(message.body_md)
-        return cls(
+            if message.body_html is not None:
+                formatted_body = FormattedText.construct(
+                    gfm=message.body_md, html=message.body_html
+                )
+            else:
+                formatted_body = FormattedText.from_gfm(message.body_md)
+        # construct() skips per-field validation: every value here is
+        # either produced by the domain model or already a FormattedText.
+        return cls.construct(
             id=message.identifier,
             summary=formatted_summary,
             body=formatted_body,
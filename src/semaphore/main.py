@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
+from contextlib import asynccontextmanager
 from importlib.metadata import version
+from typing import AsyncIterator
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from safir.dependencies.http_client import http_client_dependency
 from safir.logging import configure_logging
 from safir.middleware.x_forwarded import XForwardedMiddleware
@@ -22,26 +25,71 @@ from .handlers.v1 import v1_router
 
 __all__ = ["app"]
 
-configure_logging(
-    profile=config.profile,
-    log_level=config.log_level,
-    name=config.logger_name,
+if not structlog.is_configured():
+    # Avoid redundantly rebuilding the structlog processor chain when the
+    # module is re-imported (e.g. by the CLI after it has already
+    # configured logging).
+    configure_logging(
+        profile=config.profile,
+        log_level=config.log_level,
+        name=config.logger_name,
+    )
+
+_description = (
+    "Semaphore is the user message and notification system for the "
+    "Rubin Science Platform.\n\n"
+    "You can find Semaphore's user and developer documentation at "
+    "[https://semaphore.lsst.io](https://semaphore.lsst.io). "
+    "Semaphore is developed at [https://github.com/lsst-sqre/semaphore]"
+    "(https://github.com/lsst-sqre/semaphore)"
 )
+"""The API documentation description, built once at import time."""
+
+_url_prefix = f"/{config.name}"
+"""The app's URL path prefix, formatted once instead of per-URL."""
+
+_version = version("semaphore")
+"""The installed package version, looked up once at import time.
+
+`importlib.metadata.version` walks the installed distribution metadata,
+so the result is cached rather than re-queried wherever the version is
+needed.
+"""
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Set up and tear down the application's resources.
+
+    On startup, the broadcast repository is bootstrapped from GitHub (when
+    the GitHub App integration is enabled). On shutdown, the shared HTTP
+    client is closed.
+    """
+    logger = structlog.get_logger(config.logger_name)
+    logger.info("Running startup")
+
+    broadcast_repo = await broadcast_repo_dependency()
+    if config.enable_github_app:
+        await bootstrap_broadcast_repo(
+            http_client=await http_client_dependency(),
+            broadcast_repo=broadcast_repo,
+            logger=logger,
+        )
+
+    yield
+
+    await http_client_dependency.aclose()
+
 
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="Semaphore",
-    description=(
-        "Semaphore is the user message and notification system for the "
-        "Rubin Science Platform.\n\n"
-        "You can find Semaphore's user and developer documentation at "
-        "[https://semaphore.lsst.io](https://semaphore.lsst.io). "
-        "Semaphore is developed at [https://github.com/lsst-sqre/semaphore]"
-        "(https://github.com/lsst-sqre/semaphore)"
-    ),
-    version=version("semaphore"),
-    docs_url=f"/{config.name}/docs",
-    redoc_url=f"/{config.name}/redoc",
-    openapi_url=f"/{config.name}/openapi.json",
+    description=_description,
+    version=_version,
+    docs_url=f"{_url_prefix}/docs",
+    redoc_url=f"{_url_prefix}/redoc",
+    openapi_url=f"{_url_prefix}/openapi.json",
 )
 app.include_router(internal_router)
 app.include_router(external_router)
@@ -59,25 +107,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    logger = structlog.get_logger(config.logger_name)
-    logger.info("Running startup")
-
-    broadcast_repo = await broadcast_repo_dependency()
-    if config.enable_github_app:
-        await bootstrap_broadcast_repo(
-            http_client=await http_client_dependency(),
-            broadcast_repo=broadcast_repo,
-            logger=logger,
-        )
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    await http_client_dependency.aclose()
-
-
 def create_openapi() -> str:
     """Create the OpenAPI spec for static documentation."""
     spec = get_openapi(
@@ -0,0 +1,31 @@
+"""Shared fixtures for broadcast tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Callable, Dict
+
+
+@pytest.fixture(scope="session")
+def broadcast_text(broadcasts_dir: Path) -> Callable[[str], str]:
+    """Get the text of a sample broadcast message file by name.
+
+    The returned callable reads each file from disk at most once per test
+    session; many tests parse the same sample files, so their content is
+    cached rather than re-read per test.
+    """
+    cache: Dict[str, str] = {}
+
+    def _read(source_path: str) -> str:
+        if source_path not in cache:
+            cache[source_path] = broadcasts_dir.joinpath(
+                source_path
+            ).read_text()
+        return cache[source_path]
+
+    return _read
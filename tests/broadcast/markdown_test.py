@@ -25,6 +25,7 @@ from semaphore.broadcast.models import (
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Callable, List, Optional
 
 
 @pytest.mark.parametrize(
@@ -65,56 +66,122 @@ def test_parse_timedelta(value: str, expected: datetime.timedelta) -> None:
     assert td == expected
 
 
-def test_evergreen(broadcasts_dir: Path) -> None:
-    source_path = "evergreen.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+@pytest.mark.parametrize("value", ["1h 2h", "2d 1w", "1x", "hours"])
+def test_parse_timedelta_invalid(value: str) -> None:
+    """Repeated units, out-of-order units, and unknown terms are parse
+    errors.
+    """
+    with pytest.raises(ValueError):
+        parse_timedelta(value)
 
-    expected_summary = "The markdown-formatted broadcast message."
-    expected_body = (
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-
-    md = BroadcastMarkdown(text, source_path)
-    assert md.text == text
-    assert md.metadata.summary == expected_summary
-    assert md.metadata.env is None
-    assert md.body == expected_body
 
-    broadcast = md.to_broadcast()
-    assert isinstance(broadcast.scheduler, PermaScheduler)
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body
-    assert broadcast.identifier == source_path
-    assert broadcast.active is True
-    assert broadcast.stale is False
-    assert broadcast.category == "maintenance"
+_SUMMARY = "The markdown-formatted broadcast message."
+"""Summary text shared by several sample broadcast files."""
 
+_EXTENDED_BODY = (
+    "The extended message body, shown *only* when the user interacts "
+    "with the message, and formatted as markdown.\n"
+)
+"""Body text shared by several sample broadcast files."""
 
-def test_evergreen_no_body(broadcasts_dir: Path) -> None:
-    source_path = "evergreen-no-body.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
 
-    expected_summary = "This message doesn't have body content."
-    expected_body = None
+@pytest.mark.parametrize(
+    "source_path,meta_summary,env,body_pre,summary,body,category",
+    [
+        (
+            "evergreen.md",
+            _SUMMARY,
+            None,
+            _EXTENDED_BODY,
+            _SUMMARY,
+            _EXTENDED_BODY,
+            "maintenance",
+        ),
+        (
+            "evergreen-no-body.md",
+            "This message doesn't have body content.",
+            None,
+            None,
+            "This message doesn't have body content.",
+            None,
+            "maintenance",
+        ),
+        (
+            "evergreen-info.md",
+            None,
+            None,
+            "Informational markdown-formatted broadcast message.\n\n"
+            + _EXTENDED_BODY,
+            "Informational markdown-formatted broadcast message.",
+            _EXTENDED_BODY,
+            "info",
+        ),
+        (
+            "env-list.md",
+            None,
+            ["idfprod", "stable"],
+            _SUMMARY + "\n\n" + _EXTENDED_BODY,
+            _SUMMARY,
+            _EXTENDED_BODY,
+            "maintenance",
+        ),
+        (
+            "env-string.md",
+            None,
+            ["idfprod"],
+            _SUMMARY + "\n\n" + _EXTENDED_BODY,
+            _SUMMARY,
+            _EXTENDED_BODY,
+            "maintenance",
+        ),
+        (
+            "summary.md",
+            None,
+            None,
+            "There is no summary here,\njust a couple of title "
+            "lines\n\nHere's some body text!\n\nMore body text\n",
+            "There is no summary here,\njust a couple of title lines",
+            "Here's some body text!\n\nMore body text\n",
+            "maintenance",
+        ),
+    ],
+)
+def test_message_content(
+    broadcast_text: Callable[[str], str],
+    source_path: str,
+    meta_summary: Optional[str],
+    env: Optional[List[str]],
+    body_pre: Optional[str],
+    summary: str,
+    body: Optional[str],
+    category: str,
+) -> None:
+    """Test content extraction for always-scheduled sample messages.
+
+    Each case checks the parsed metadata, the markdown body, and the
+    broadcast produced by to_broadcast.
+    """
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     assert md.text == text
-    assert md.metadata.summary == expected_summary
-    assert md.metadata.env is None
-    assert md.body is expected_body
+    assert md.metadata.summary == meta_summary
+    assert md.metadata.env == env
+    assert md.body == body_pre
 
     broadcast = md.to_broadcast()
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body
+    assert isinstance(broadcast.scheduler, PermaScheduler)
+    assert broadcast.summary_md == summary
+    assert broadcast.body_md == body
     assert broadcast.identifier == source_path
     assert broadcast.active is True
     assert broadcast.stale is False
+    assert broadcast.category == category
 
 
-def test_evergreen_disabled(broadcasts_dir: Path) -> None:
+def test_evergreen_disabled(broadcast_text: Callable[[str], str]) -> None:
     source_path = "evergreen-disabled.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     broadcast = md.to_broadcast()
@@ -122,121 +189,9 @@ def test_evergreen_disabled(broadcasts_dir: Path) -> None:
     assert broadcast.scheduler.is_active() is True
 
 
-def test_evergreen_info(broadcasts_dir: Path) -> None:
-    source_path = "evergreen-info.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
-
-    expected_summary = "Informational markdown-formatted broadcast message."
-    expected_body_pre = (
-        "Informational markdown-formatted broadcast message.\n\n"
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-    expected_body_post = (
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-
-    md = BroadcastMarkdown(text, source_path)
-    assert md.text == text
-    assert md.metadata.summary is None
-    assert md.metadata.env is None
-    assert md.body == expected_body_pre
-
-    broadcast = md.to_broadcast()
-    assert isinstance(broadcast.scheduler, PermaScheduler)
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body_post
-    assert broadcast.identifier == source_path
-    assert broadcast.active is True
-    assert broadcast.stale is False
-    assert broadcast.category == "info"
-
-
-def test_env_list(broadcasts_dir: Path) -> None:
-    source_path = "env-list.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
-
-    expected_summary = "The markdown-formatted broadcast message."
-    expected_body_pre = (
-        "The markdown-formatted broadcast message.\n\n"
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-    expected_body_post = (
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-
-    md = BroadcastMarkdown(text, source_path)
-    assert md.metadata.summary is None
-    assert md.metadata.env == ["idfprod", "stable"]
-    assert md.body == expected_body_pre
-
-    broadcast = md.to_broadcast()
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body_post
-    assert broadcast.identifier == source_path
-    assert broadcast.active is True
-    assert broadcast.stale is False
-
-
-def test_env_string(broadcasts_dir: Path) -> None:
-    source_path = "env-string.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
-
-    expected_summary = "The markdown-formatted broadcast message."
-    expected_body_pre = (
-        "The markdown-formatted broadcast message.\n\n"
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-    expected_body_post = (
-        "The extended message body, shown *only* when the user interacts "
-        "with the message, and formatted as markdown.\n"
-    )
-
-    md = BroadcastMarkdown(text, source_path)
-    assert md.metadata.summary is None
-    assert md.metadata.env == ["idfprod"]
-    assert md.body == expected_body_pre
-
-    broadcast = md.to_broadcast()
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body_post
-    assert broadcast.identifier == source_path
-    assert broadcast.active is True
-    assert broadcast.stale is False
-
-
-def test_summary(broadcasts_dir: Path) -> None:
-    source_path = "summary.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
-
-    expected_summary = (
-        "There is no summary here,\njust a couple of title lines"
-    )
-    expected_body_pre = (
-        "There is no summary here,\njust a couple of title "
-        "lines\n\nHere's some body text!\n\nMore body text\n"
-    )
-    expected_body_post = "Here's some body text!\n\nMore body text\n"
-
-    md = BroadcastMarkdown(text, source_path)
-    assert md.text == text
-    assert md.metadata.summary is None
-    assert md.body == expected_body_pre
-
-    broadcast = md.to_broadcast()
-
-    assert broadcast.summary_md == expected_summary
-    assert broadcast.body_md == expected_body_post
-    assert broadcast.identifier == source_path
-
-
-def test_defer_expire(broadcasts_dir: Path) -> None:
+def test_defer_expire(broadcast_text: Callable[[str], str]) -> None:
     source_path = "defer-expire.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     expected_summary = "The markdown-formatted broadcast message."
     expected_body_pre = (
@@ -270,9 +225,9 @@ def test_defer_expire(broadcasts_dir: Path) -> None:
     )
 
 
-def test_defer_expire_fuzzy(broadcasts_dir: Path) -> None:
+def test_defer_expire_fuzzy(broadcast_text: Callable[[str], str]) -> None:
     source_path = "defer-expire-fuzzy.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     expected_summary = "The markdown-formatted broadcast message.\n"
     expected_body_pre = "The markdown-formatted broadcast message.\n"
@@ -299,9 +254,11 @@ def test_defer_expire_fuzzy(broadcasts_dir: Path) -> None:
     )
 
 
-def test_defer_expire_fuzzy_default_tz(broadcasts_dir: Path) -> None:
+def test_defer_expire_fuzzy_default_tz(
+    broadcast_text: Callable[[str], str]
+) -> None:
     source_path = "defer-expire-fuzzy-default-tz.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     assert md.metadata.timezone == dateutil.tz.gettz("America/Los Angeles")
@@ -318,9 +275,9 @@ def test_defer_expire_fuzzy_default_tz(broadcasts_dir: Path) -> None:
     )
 
 
-def test_defer_ttl(broadcasts_dir: Path) -> None:
+def test_defer_ttl(broadcast_text: Callable[[str], str]) -> None:
     source_path = "defer-ttl.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     broadcast = md.to_broadcast()
@@ -334,9 +291,9 @@ def test_defer_ttl(broadcasts_dir: Path) -> None:
     )
 
 
-def test_defer_noexpire(broadcasts_dir: Path) -> None:
+def test_defer_noexpire(broadcast_text: Callable[[str], str]) -> None:
     source_path = "defer-noexpire.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     broadcast = md.to_broadcast()
@@ -347,9 +304,9 @@ def test_defer_noexpire(broadcasts_dir: Path) -> None:
     )
 
 
-def test_expire(broadcasts_dir: Path) -> None:
+def test_expire(broadcast_text: Callable[[str], str]) -> None:
     source_path = "expire.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
 
     md = BroadcastMarkdown(text, source_path)
     broadcast = md.to_broadcast()
@@ -360,9 +317,9 @@ def test_expire(broadcasts_dir: Path) -> None:
     )
 
 
-def test_patch_thursday(broadcasts_dir: Path) -> None:
+def test_patch_thursday(broadcast_text: Callable[[str], str]) -> None:
     source_path = "patch-thursday.md"
-    text = broadcasts_dir.joinpath(source_path).read_text()
+    text = broadcast_text(source_path)
     md = BroadcastMarkdown(text, source_path)
     broadcast = md.to_broadcast()
     scheduler = broadcast.scheduler
@@ -392,3 +349,11 @@ def test_frontmatter_expire_before_defer() -> None:
                 expire="2021-01-01 1pm",
             )
         )
+
+
+def test_load_many(broadcasts_dir: Path) -> None:
+    """Test loading a directory of broadcast files concurrently."""
+    paths = sorted(broadcasts_dir.glob("*.md"))
+    broadcasts = BroadcastMarkdown.load_many(paths)
+    assert [b.identifier for b in broadcasts] == [p.name for p in paths]
+    assert BroadcastMarkdown.load_many([]) == []
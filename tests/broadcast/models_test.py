@@ -5,11 +5,12 @@ from __future__ import annotations
 import datetime
 
 import arrow
-from dateutil.rrule import DAILY, HOURLY, rrule, rruleset
+from dateutil.rrule import DAILY, HOURLY, MONTHLY, TH, rrule, rruleset
 
 from semaphore.broadcast.models import (
     BroadcastMessage,
     FixedExpirationScheduler,
+    MonthlyNthWeekdayScheduler,
     OneTimeScheduler,
     OpenEndedScheduler,
     PermaScheduler,
@@ -187,3 +188,26 @@ def test_recurringing_propose_next() -> None:
     assert s.is_stale() is False
     assert s._start == now
     assert s._end == now.shift(seconds=ttl.total_seconds())
+
+
+def test_monthly_nth_weekday() -> None:
+    """Test that MonthlyNthWeekdayScheduler computes the same occurrences
+    as the rule set it summarizes.
+    """
+    # Offset the start three hours ahead of "now" so that occurrence
+    # windows (two hours long, at the start's wall-clock time) can never
+    # contain the current time, keeping is_active deterministic even when
+    # the test runs on a third Thursday.
+    start = arrow.utcnow().floor("second").shift(years=-1, hours=3)
+    ttl = datetime.timedelta(hours=2)
+    rset = rruleset(cache=True)
+    rset.rrule(rrule(freq=MONTHLY, dtstart=start.datetime, byweekday=TH(3)))
+    s = MonthlyNthWeekdayScheduler(rset, ttl, weekday=3, index=3)
+    probe = start.datetime
+    for _ in range(24):
+        occurrence = s._next_occurrence(probe)
+        assert occurrence == rset.after(probe)
+        probe = occurrence
+    assert s.is_active() is False
+    assert s.has_future_events() is True
+    assert s.is_stale() is False
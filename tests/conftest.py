@@ -2,41 +2,76 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 import pytest_asyncio
 from asgi_lifespan import LifespanManager
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 from semaphore import main
+from semaphore.dependencies.broadcastrepo import broadcast_repo_dependency
 
 if TYPE_CHECKING:
-    from typing import AsyncIterator
+    from typing import AsyncIterator, Iterator
 
     from fastapi import FastAPI
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Session-scoped event loop, so that the app and client fixtures can
+    span the whole test session.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def app() -> AsyncIterator[FastAPI]:
     """Return a configured test application.
 
     Wraps the application in a lifespan manager so that startup and shutdown
-    events are sent during test execution.
+    events are sent during test execution. The application is started once
+    per session; per-test isolation is provided by the
+    ``reset_broadcast_repo`` fixture.
     """
     async with LifespanManager(main.app):
         yield main.app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
-    """Return an ``httpx.AsyncClient`` configured to talk to the test app."""
-    async with AsyncClient(app=app, base_url="https://example.com/") as client:
+    """Return an ``httpx.AsyncClient`` configured to talk to the test app.
+
+    The client speaks to the app in-process through an ASGI transport, so
+    no sockets or real HTTP connections are involved.
+    """
+    # httpx 0.24 annotates the app argument with a narrower ASGI callable
+    # type than FastAPI's __call__ signature.
+    transport = ASGITransport(app=app)  # type: ignore[arg-type]
+    async with AsyncClient(
+        transport=transport, base_url="https://example.com/"
+    ) as client:
         yield client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(autouse=True)
+async def reset_broadcast_repo() -> AsyncIterator[None]:
+    """Clear the broadcast message repository after each test.
+
+    The application (and with it the repository singleton) is shared
+    across the session, so each test starts from an empty repository.
+    """
+    yield
+    repo = await broadcast_repo_dependency()
+    repo.clear()
+
+
+@pytest.fixture(scope="session")
 def broadcasts_dir() -> Path:
     """Directory containing test broadcast markdown messages."""
     return Path(__file__).parent.joinpath("data/broadcasts")